@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import boto3
 import logging
 import os
 import sys
+import time
 import traceback
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request
@@ -93,58 +95,117 @@ class KnowledgeBaseResponse(BaseModel):
     kb_id: str
 
 
-# Connect to the MCP server and create an agent
-async def process_query(query: str, kb_id: str) -> Dict[str, Any]:
-    """Process a query using the Bedrock KB through MCP server.
+# MCP client is created once and reused across requests; spawning a new
+# stdio subprocess per query adds several seconds of latency to every call.
+_mcp_client = None
+_mcp_client_lock = asyncio.Lock()
 
-    Args:
-        query: The user's query
-        kb_id: The knowledge base ID to query
+
+async def get_mcp_client() -> MultiServerMCPClient:
+    """Get the shared MCP client, creating it on first use.
 
     Returns:
-        A dictionary with the processed messages
+        The persistent MultiServerMCPClient instance
     """
-    logger.info(f"Processing query: '{query}' for KB ID: {kb_id}")
+    global _mcp_client
+    if _mcp_client is None:
+        async with _mcp_client_lock:
+            if _mcp_client is None:
+                logger.info('Initializing MCP client with awslabs.bedrock-kb-retrieval-mcp-server')
+                _mcp_client = MultiServerMCPClient(
+                    {
+                        'bedrock_kb': {
+                            'transport': 'stdio',
+                            'command': 'uvx',
+                            'args': ['awslabs.bedrock-kb-retrieval-mcp-server@latest'],
+                            'env': {
+                                'AWS_PROFILE': os.getenv('AWS_PROFILE', 'default'),
+                                'AWS_REGION': os.getenv('AWS_REGION', 'us-west-2'),
+                                'FASTMCP_LOG_LEVEL': 'ERROR',
+                            },
+                        }
+                    }
+                )
+    return _mcp_client
 
-    try:
-        # Initialize MCP client using the awslabs.bedrock-kb-retrieval-mcp-server
-        logger.info('Initializing MCP client with awslabs.bedrock-kb-retrieval-mcp-server')
-        mcp_client = MultiServerMCPClient(
-            {
-                'bedrock_kb': {
-                    'transport': 'stdio',
-                    'command': 'uvx',
-                    'args': ['awslabs.bedrock-kb-retrieval-mcp-server@latest'],
-                    'env': {
-                        'AWS_PROFILE': os.getenv('AWS_PROFILE', 'default'),
-                        'AWS_REGION': os.getenv('AWS_REGION', 'us-west-2'),
-                        'FASTMCP_LOG_LEVEL': 'ERROR',
-                    },
-                }
-            }
-        )
 
-        # Create a Bedrock LLM
-        logger.info('Creating Bedrock LLM')
-        if not bedrock_runtime:
-            raise ValueError('Bedrock client is not initialized')
+# Tool list is cached with a TTL so each request doesn't round-trip to the
+# MCP server; the cache maps tool names to tools for O(1) lookup.
+TOOL_CACHE_TTL_SECONDS = 300
+_tools_by_name = None
+_tools_fetched_at = 0.0
+_tool_cache_lock = asyncio.Lock()
 
-        # Get tools from the MCP server
-        logger.info('Getting tools from MCP server')
-        tools = await mcp_client.get_tools()
-        logger.info(
-            f'Retrieved {len(tools)} tools from MCP server: {[tool.name for tool in tools]}'
-        )
 
-        if not tools:
-            logger.warning('No tools were returned from the MCP server')
-            return {
-                'messages': [{'content': 'No tools available from the knowledge base server.'}]
-            }
+async def get_mcp_tools() -> Dict[str, Any]:
+    """Get tools from the MCP server, cached by name with a TTL.
+
+    Returns:
+        Dictionary mapping tool names to tools
+    """
+    global _tools_by_name, _tools_fetched_at
+
+    if _tools_by_name is None or time.monotonic() - _tools_fetched_at > TOOL_CACHE_TTL_SECONDS:
+        async with _tool_cache_lock:
+            if (
+                _tools_by_name is None
+                or time.monotonic() - _tools_fetched_at > TOOL_CACHE_TTL_SECONDS
+            ):
+                mcp_client = await get_mcp_client()
+                logger.info('Getting tools from MCP server')
+                tools = await mcp_client.get_tools()
+                logger.info(
+                    'Retrieved %d tools from MCP server: %s',
+                    len(tools),
+                    [tool.name for tool in tools],
+                )
+                _tools_by_name = {tool.name: tool for tool in tools}
+                _tools_fetched_at = time.monotonic()
+
+    return _tools_by_name
+
+
+@app.on_event('startup')
+async def preconnect_mcp():
+    """Kick off MCP connection and tool discovery in the background.
+
+    The first query would otherwise pay for server subprocess startup and
+    tool listing; failures are logged and the first request retries.
+    """
+
+    async def warm_up():
+        try:
+            await get_mcp_tools()
+        except Exception:
+            logger.exception('MCP warm-up failed; first request will retry')
+
+    asyncio.create_task(warm_up())
+
+
+# Chat model and its tool binding are cached across requests; the model is
+# rebound only if the tool set reported by the MCP server changes.
+_chat_model = None
+_model_with_tools = None
+_bound_tool_names = None
 
-        # Create a ChatBedrock instance with tools
-        logger.info('Creating ChatBedrock with tools')
-        chat_model = ChatBedrock(
+
+def get_model_with_tools(tools: List[Any]):
+    """Get the ChatBedrock model with the given tools bound.
+
+    Args:
+        tools: Tools retrieved from the MCP server
+
+    Returns:
+        The cached ChatBedrock model with tools bound
+    """
+    global _chat_model, _model_with_tools, _bound_tool_names
+
+    if not bedrock_runtime:
+        raise ValueError('Bedrock client is not initialized')
+
+    if _chat_model is None:
+        logger.info('Creating ChatBedrock model')
+        _chat_model = ChatBedrock(
             client=bedrock_runtime,
             model_id='anthropic.claude-3-sonnet-20240229-v1:0',
             model_kwargs={
@@ -156,9 +217,40 @@ async def process_query(query: str, kb_id: str) -> Dict[str, Any]:
             system_prompt_with_tools=SYSTEM_PROMPT,
         )
 
-        # Prepare tools for Bedrock
-        logger.info('Preparing tools for Bedrock')
-        model = chat_model.bind_tools(tools)
+    tool_names = tuple(tool.name for tool in tools)
+    if _model_with_tools is None or tool_names != _bound_tool_names:
+        logger.info('Binding tools to ChatBedrock model')
+        _model_with_tools = _chat_model.bind_tools(tools)
+        _bound_tool_names = tool_names
+
+    return _model_with_tools
+
+
+# Connect to the MCP server and create an agent
+async def process_query(query: str, kb_id: str) -> Dict[str, Any]:
+    """Process a query using the Bedrock KB through MCP server.
+
+    Args:
+        query: The user's query
+        kb_id: The knowledge base ID to query
+
+    Returns:
+        A dictionary with the processed messages
+    """
+    logger.info("Processing query: '%s' for KB ID: %s", query, kb_id)
+
+    try:
+        # Get the cached tool index, refreshing from the MCP server on expiry
+        tools_by_name = await get_mcp_tools()
+
+        if not tools_by_name:
+            logger.warning('No tools were returned from the MCP server')
+            return {
+                'messages': [{'content': 'No tools available from the knowledge base server.'}]
+            }
+
+        # Reuse the cached ChatBedrock model with tools bound
+        model = get_model_with_tools(list(tools_by_name.values()))
 
         # Start conversation with Bedrock - include KB ID in the message
         kb_info = f'Use knowledge base ID: {kb_id} for any knowledge base queries.'
@@ -173,24 +265,20 @@ async def process_query(query: str, kb_id: str) -> Dict[str, Any]:
         # Check if Bedrock requested a tool
         if hasattr(response, 'tool_calls') and response.tool_calls:
             logger.info('Bedrock requested tool use')
-            logger.info(f'Tool calls: {response.tool_calls}')
+            logger.info('Tool calls: %s', response.tool_calls)
 
             for tool_call in response.tool_calls:
                 tool_name = tool_call['name']
                 tool_args = tool_call['args']
                 tool_id = tool_call['id']
 
-                logger.info(f'Tool requested: {tool_name} with args: {tool_args}')
+                logger.info('Tool requested: %s with args: %s', tool_name, tool_args)
 
-                # Find the requested tool
-                requested_tool = None
-                for tool in tools:
-                    if tool.name == tool_name:
-                        requested_tool = tool
-                        break
+                # Find the requested tool by name
+                requested_tool = tools_by_name.get(tool_name)
 
                 if not requested_tool:
-                    logger.warning(f'Requested tool {tool_name} not found')
+                    logger.warning('Requested tool %s not found', tool_name)
                     continue
 
                 # For query_knowledge_base tool, ensure we use the correct KB ID
@@ -199,14 +287,14 @@ async def process_query(query: str, kb_id: str) -> Dict[str, Any]:
                     tool_args['kb_id'] = kb_id
 
                 # Execute the tool
-                logger.info(f'Executing tool {tool_name}')
+                logger.info('Executing tool %s', tool_name)
                 tool_result = await requested_tool.ainvoke(tool_args)
-                logger.debug(f'Tool result: {tool_result}')
+                logger.debug('Tool result: %s', tool_result)
 
-                # Create a new conversation with the tool response - use the original query
-                new_messages = [HumanMessage(content=enhanced_query)]
-                new_messages.append(response)  # Add the original AI response with tool_calls
-                new_messages.append(
+                # Continue the original conversation with the tool response
+                # instead of rebuilding the message list from scratch
+                messages.append(response)  # Add the original AI response with tool_calls
+                messages.append(
                     ToolMessage(
                         content=str(tool_result),
                         tool_call_id=tool_id,
@@ -216,7 +304,7 @@ async def process_query(query: str, kb_id: str) -> Dict[str, Any]:
 
                 # Get final response from Bedrock with tool results
                 logger.info('Sending tool results back to Bedrock')
-                final_response = await model.ainvoke(new_messages)
+                final_response = await model.ainvoke(messages)
                 response_content = str(final_response.content)
 
                 return {'messages': [{'content': response_content}]}
@@ -225,8 +313,7 @@ async def process_query(query: str, kb_id: str) -> Dict[str, Any]:
         return {'messages': [{'content': response.content}]}
 
     except Exception as e:
-        logger.error(f'Error in process_query: {str(e)}')
-        logger.error(traceback.format_exc())
+        logger.exception('Error in process_query')
         raise HTTPException(status_code=500, detail=f'Error processing query: {str(e)}')
 
 
@@ -234,14 +321,13 @@ async def process_query(query: str, kb_id: str) -> Dict[str, Any]:
 @app.post('/query', response_model=QueryResponse)
 async def query(request: QueryRequest):
     """Process a query using the Bedrock KB."""
-    logger.info(f'Received query request: {request.query}, KB ID: {request.kb_id}')
+    logger.info('Received query request: %s, KB ID: %s', request.query, request.kb_id)
     try:
         result = await process_query(request.query, request.kb_id)
         logger.info('Query processed successfully')
         return result
     except Exception as e:
-        logger.error(f'Error processing query: {str(e)}')
-        logger.error(traceback.format_exc())
+        logger.exception('Error processing query')
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -16,6 +16,7 @@ import json
 import requests
 import streamlit as st
 import time
+from collections import deque
 
 
 # Set page configuration
@@ -84,6 +85,34 @@ else:
 # API configuration
 API_URL = 'http://localhost:8000'
 
+# Number of words to accumulate before updating the chat placeholder;
+# re-rendering markdown on every word makes long answers noticeably slow
+STREAM_BATCH_SIZE = 8
+
+# Maximum number of chat messages kept in session state; older messages are
+# dropped so long-lived sessions don't grow without bound
+MAX_HISTORY_MESSAGES = 50
+
+
+def extract_content(message):
+    """Extract display text from an API message, unwrapping JSON payloads.
+
+    Plain text is returned as-is; a JSON parse is only attempted when the
+    content could actually be a JSON document.
+    """
+    content = message.get('content', '')
+
+    if isinstance(content, str) and content.lstrip().startswith(('{', '[')):
+        try:
+            json_content = json.loads(content)
+            if isinstance(json_content, dict) and 'content' in json_content:
+                return json_content['content']
+        except json.JSONDecodeError:
+            # Not valid JSON after all, use as is
+            pass
+
+    return content
+
 
 def query_api(prompt, kb_id):
     """Send a query to the FastAPI server and get the response."""
@@ -99,7 +128,7 @@ def query_api(prompt, kb_id):
 
 
 if 'messages' not in st.session_state:
-    st.session_state.messages = []
+    st.session_state.messages = deque(maxlen=MAX_HISTORY_MESSAGES)
 
 for message in st.session_state.messages:
     with st.chat_message(message['role']):
@@ -123,28 +152,28 @@ if prompt := st.chat_input('What would you like to ask your Bedrock Knowledge Ba
                 with st.spinner('Processing your query...'):
                     messages = query_api(prompt, st.session_state.current_kb_id)
 
+                # Accumulate response pieces in a list and join once per
+                # render instead of rebuilding the string on every word
+                response_parts = []
+
                 # Process the response
                 for message in messages:
-                    content = message.get('content', '')
-
-                    # Check if content is JSON and extract relevant parts
-                    try:
-                        json_content = json.loads(content)
-                        if isinstance(json_content, dict) and 'content' in json_content:
-                            content = json_content['content']
-                    except (json.JSONDecodeError, TypeError):
-                        # Not JSON or not the expected format, use as is
-                        pass
-
-                    # Simulate stream of response with milliseconds delay
-                    for chunk in content.split(' '):
-                        full_response += chunk + ' '
+                    content = extract_content(message)
+
+                    # Simulate stream of response with milliseconds delay,
+                    # re-rendering once per batch of words instead of per word
+                    for i, chunk in enumerate(content.split(' ')):
+                        response_parts.append(chunk + ' ')
                         if chunk.endswith('\n'):
-                            full_response += ' '
-                        time.sleep(0.05)
+                            response_parts.append(' ')
+
+                        # Add a blinking cursor to simulate typing; the
+                        # delay happens once per batch, not after every word
+                        if (i + 1) % STREAM_BATCH_SIZE == 0:
+                            time.sleep(0.05)
+                            message_placeholder.markdown(''.join(response_parts) + '▌')
 
-                        # Add a blinking cursor to simulate typing
-                        message_placeholder.markdown(full_response + '▌')
+                full_response = ''.join(response_parts)
             except Exception as e:
                 full_response = f'Error: {str(e)}'
 
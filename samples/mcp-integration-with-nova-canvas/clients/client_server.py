@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import boto3
 import json
 import logging
@@ -26,6 +27,28 @@ from pydantic import BaseModel, Field
 from typing import Any, Dict, List, Optional
 
 
+# orjson is an optional fast path for the JSON payloads exchanged with
+# Bedrock and the MCP tools; the stdlib json module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+
+def json_loads(data: Any) -> Any:
+    """Parse JSON from a string or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -100,6 +123,66 @@ class ImageGenerationResponse(BaseModel):
     improved_prompt: Optional[str] = ''
 
 
+# MCP client is created once and reused; each tool invocation opens its own
+# session against the server, so concurrent requests do not serialize on a
+# single stdio pipe.
+_mcp_client = None
+_mcp_client_lock = asyncio.Lock()
+
+
+async def get_mcp_client() -> MultiServerMCPClient:
+    """Get the shared MCP client, creating it on first use.
+
+    Returns:
+        The persistent MultiServerMCPClient instance
+    """
+    global _mcp_client
+    if _mcp_client is None:
+        async with _mcp_client_lock:
+            if _mcp_client is None:
+                logger.info('Initializing MCP client with awslabs.nova-canvas-mcp-server')
+                _mcp_client = MultiServerMCPClient(
+                    {
+                        'nova_canvas': {
+                            'transport': 'stdio',
+                            'command': 'uvx',
+                            'args': ['awslabs.nova-canvas-mcp-server@latest'],
+                            'env': {
+                                'AWS_PROFILE': os.getenv('AWS_PROFILE', 'default'),
+                                'AWS_REGION': os.getenv('AWS_REGION', 'us-east-1'),
+                            },
+                        }
+                    }
+                )
+    return _mcp_client
+
+
+def extract_image_paths(tool_result: Any) -> List[str]:
+    """Extract local image paths from an MCP tool result.
+
+    Normalizes the result shape once: strings are parsed as JSON, then paths
+    are read from the resulting dictionary.
+
+    Args:
+        tool_result: Raw result returned by the MCP tool
+
+    Returns:
+        List of filesystem paths, empty if none were found
+    """
+    if isinstance(tool_result, str):
+        try:
+            tool_result = json_loads(tool_result)
+        except ValueError:
+            logger.error('Tool result is not valid JSON: %s', tool_result)
+            return []
+
+    if not isinstance(tool_result, dict) or not tool_result.get('paths'):
+        return []
+
+    # Convert file:// URLs to plain filesystem paths
+    return [path[7:] if path.startswith('file://') else path for path in tool_result['paths']]
+
+
 # Function to improve prompts with Nova Text Model
 async def improve_prompt_with_nova_text(prompt: str) -> str:
     """Improve the image generation prompt using Nova Text Model.
@@ -155,21 +238,21 @@ async def improve_prompt_with_nova_text(prompt: str) -> str:
 
         # Call Nova Text Model through Bedrock
         response = bedrock_runtime.invoke_model(
-            modelId='amazon.nova-micro-v1:0', body=json.dumps(request_body)
+            modelId='amazon.nova-micro-v1:0', body=json_dumps(request_body)
         )
 
         # Parse response
-        response_body = json.loads(response['body'].read())
-        logger.info(f'Response body: {response_body}')
+        response_body = json_loads(response['body'].read())
+        logger.debug('Response body: %s', response_body)
         improved_prompt = response_body['output']['message']['content'][0]['text'].strip()
 
-        logger.info(f"Original prompt: '{prompt}'")
-        logger.info(f"Improved prompt: '{improved_prompt}'")
+        logger.info("Original prompt: '%s'", prompt)
+        logger.info("Improved prompt: '%s'", improved_prompt)
 
         return improved_prompt
 
-    except Exception as e:
-        logger.error(f'Error improving prompt with Nova Text Model: {str(e)}')
+    except Exception:
+        logger.exception('Error improving prompt with Nova Text Model')
         # Return original prompt if improvement fails
         return prompt
 
@@ -184,7 +267,7 @@ async def generate_image(request: ImageGenerationRequest) -> Dict[str, Any]:
     Returns:
         A dictionary with the generation results
     """
-    logger.info(f"Processing image generation request with prompt: '{request.prompt}'")
+    logger.info("Processing image generation request with prompt: '%s'", request.prompt)
 
     try:
         # Check if use_improved_prompt is True
@@ -195,21 +278,8 @@ async def generate_image(request: ImageGenerationRequest) -> Dict[str, Any]:
             # Update the request with improved prompt
             request.prompt = improved_prompt
 
-        # Initialize MCP client using the awslabs.nova-canvas-mcp-server
-        logger.info('Initializing MCP client with awslabs.nova-canvas-mcp-server')
-        mcp_client = MultiServerMCPClient(
-            {
-                'nova_canvas': {
-                    'transport': 'stdio',
-                    'command': 'uvx',
-                    'args': ['awslabs.nova-canvas-mcp-server@latest'],
-                    'env': {
-                        'AWS_PROFILE': os.getenv('AWS_PROFILE', 'default'),
-                        'AWS_REGION': os.getenv('AWS_REGION', 'us-east-1'),
-                    },
-                }
-            }
-        )
+        # Reuse the persistent MCP client instead of creating one per request
+        mcp_client = await get_mcp_client()
 
         # Get tools from the MCP server
         logger.info('Getting tools from MCP server')
@@ -230,7 +300,7 @@ async def generate_image(request: ImageGenerationRequest) -> Dict[str, Any]:
         logger.info('Determining which tool to use based on request parameters')
         if request.colors:
             # Use color-guided generation
-            logger.info(f'Using color-guided generation with {len(request.colors)} colors')
+            logger.info('Using color-guided generation with %d colors', len(request.colors))
             tool_name = 'generate_image_with_colors'
             tool_args = {
                 'prompt': request.prompt,
@@ -268,7 +338,7 @@ async def generate_image(request: ImageGenerationRequest) -> Dict[str, Any]:
                 break
 
         if not requested_tool:
-            logger.warning(f'Requested tool {tool_name} not found')
+            logger.warning('Requested tool %s not found', tool_name)
             return {
                 'status': 'error',
                 'message': f'Tool {tool_name} not found',
@@ -276,32 +346,15 @@ async def generate_image(request: ImageGenerationRequest) -> Dict[str, Any]:
             }
 
         # Execute the tool
-        logger.info(f'Executing tool {tool_name}')
-        logger.info(f'Tool arguments: {tool_args}')
+        logger.info('Executing tool %s', tool_name)
+        logger.debug('Tool arguments: %s', tool_args)
         tool_result = await requested_tool.ainvoke(tool_args)
-        logger.info(f'Tool result: {tool_result}')
+        logger.debug('Tool result: %s', tool_result)
 
-        try:
-            # If tool_result is a string, try to parse it as JSON
-            if isinstance(tool_result, str):
-                tool_result = json.loads(tool_result)
-
-            # Access paths from the dictionary
-            if isinstance(tool_result, dict) and 'paths' in tool_result:
-                logger.info(f'Image paths: {tool_result["paths"]}')
-            else:
-                logger.error(f'No paths found in tool result: {tool_result}')
-        except Exception as e:
-            logger.error(f'Error processing tool result: {e}')
-
-        # Extract image paths from the result
-        if isinstance(tool_result, dict) and 'paths' in tool_result and tool_result['paths']:
-            # Convert file:// URLs to relative paths
-            image_paths = []
-            for path in tool_result['paths']:
-                if path.startswith('file://'):
-                    path = path[7:]  # Remove file:// prefix
-                image_paths.append(path)
+        # Extract image paths from the result in a single pass
+        image_paths = extract_image_paths(tool_result)
+        if image_paths:
+            logger.info('Image paths: %s', image_paths)
 
             return {
                 'status': 'success',
@@ -319,8 +372,7 @@ async def generate_image(request: ImageGenerationRequest) -> Dict[str, Any]:
             }
 
     except Exception as e:
-        logger.error(f'Error in generate_image: {str(e)}')
-        logger.error(traceback.format_exc())
+        logger.exception('Error in generate_image')
         raise HTTPException(status_code=500, detail=f'Error generating image: {str(e)}')
 
 
@@ -328,14 +380,13 @@ async def generate_image(request: ImageGenerationRequest) -> Dict[str, Any]:
 @app.post('/generate', response_model=ImageGenerationResponse)
 async def generate(request: ImageGenerationRequest):
     """Generate an image using Nova Canvas."""
-    logger.info(f'Received image generation request with prompt: {request.prompt}')
+    logger.info('Received image generation request with prompt: %s', request.prompt)
     try:
         result = await generate_image(request)
         logger.info('Image generation processed successfully')
         return result
     except Exception as e:
-        logger.error(f'Error processing image generation: {str(e)}')
-        logger.error(traceback.format_exc())
+        logger.exception('Error processing image generation')
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -347,7 +398,6 @@ def health_check():
 
 # Run the FastAPI app with uvicorn
 if __name__ == '__main__':
-    import json
     import uvicorn
 
     uvicorn.run(app, host='127.0.0.1', port=8000)
@@ -21,6 +21,7 @@
 # limitations under the License.
 import click
 import datetime
+import functools
 import json
 import logging
 import re
@@ -151,41 +152,52 @@ class PyPiPackage:
 
     def update_version(self, build_release: BuildRelease) -> str:
         """Update version in pyproject.toml."""
-        version_str = self.package_version()
+        # Read and parse the file once; the current version comes from the
+        # same document that is rewritten below
         with open(self.path / 'pyproject.toml', encoding='utf-8') as f:
             data = tomlkit.parse(f.read())
-            # Access the version safely from tomlkit document
-            project_table = data.get('project')
-            if project_table is None:
-                raise ValueError('No project section in pyproject.toml')
-            matched = re.match(SemVerRegEx, version_str)
-            patch = int(matched.group('patch')) + 1
-            if patch > sys.maxsize:
-                patch = 0
-            version = '.'.join([matched.group('major'), matched.group('minor'), str(patch)])
 
-            # Update the version safely
-            project_table['version'] = version
+        # Access the version safely from tomlkit document
+        project_table = data.get('project')
+        if project_table is None:
+            raise ValueError('No project section in pyproject.toml')
+        version_str = project_table.get('version')
+        if not version_str:
+            raise ValueError('No version in pyproject.toml project section')
+        matched = re.match(SemVerRegEx, str(version_str))
+        patch = int(matched.group('patch')) + 1
+        if patch > sys.maxsize:
+            patch = 0
+        version = '.'.join([matched.group('major'), matched.group('minor'), str(patch)])
+
+        # Update the version safely
+        project_table['version'] = version
 
         with open(self.path / 'pyproject.toml', 'w', encoding='utf-8') as f:
             f.write(tomlkit.dumps(data))
         return version
 
 
+@functools.lru_cache(maxsize=1)
+def get_repo_root() -> str:
+    """Get the repository root directory, caching the git subprocess call."""
+    command = ['git', 'rev-parse', '--show-toplevel']
+    return subprocess.run(
+        command,
+        check=True,
+        shell=False,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
 def has_changes(path: Path, git_hash: GitHash) -> bool:
     """Check if any files changed between current state and git hash."""
     try:
         logging.debug('Checking changes in %s since %s', path, git_hash)  # import logging
 
-        # Get the repository root directory
-        command = ['git', 'rev-parse', '--show-toplevel']
-        repo_root = subprocess.run(
-            command,
-            check=True,
-            shell=False,
-            capture_output=True,
-            text=True,
-        ).stdout.strip()
+        # Get the repository root directory (cached across packages)
+        repo_root = get_repo_root()
 
         try:
             # Get the relative path from repo root to package directory
@@ -290,11 +302,15 @@ def update_packages(directory: Path, git_hash: GitHash) -> int:
     path = directory.resolve(strict=True)
     build_release = gen_buildrelease()
 
+    lines = []
     for package in find_changed_packages(path, git_hash):
         name = package.package_name()
         version = package.update_version(build_release)
 
-        click.echo(f'{name}@{version}')
+        lines.append(f'{name}@{version}')
+
+    if lines:
+        click.echo('\n'.join(lines))
 
     return 0
 
@@ -308,14 +324,14 @@ def generate_notes(directory: Path, git_hash: GitHash) -> int:
     path = directory.resolve(strict=True)
     release = gen_version()
 
-    click.echo(f'# Release: {release}')
-    click.echo('')
-    click.echo('## Updated packages')
+    lines = [f'# Release: {release}', '', '## Updated packages']
     for package in find_changed_packages(path, git_hash):
         name = package.package_name()
         version = package.package_version()
-        click.echo(f'- {name}@{version}')
-    click.echo('')
+        lines.append(f'- {name}@{version}')
+    lines.append('')
+
+    click.echo('\n'.join(lines))
 
     return 0
 
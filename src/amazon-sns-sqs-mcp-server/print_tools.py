@@ -14,6 +14,7 @@
 
 """Script to print out all registered tools and their signatures."""
 
+import sys
 from awslabs.amazon_sns_sqs_mcp_server.sns import register_sns_tools
 from awslabs.amazon_sns_sqs_mcp_server.sqs import register_sqs_tools
 from mcp.server.fastmcp import FastMCP
@@ -21,27 +22,31 @@ from mcp.server.fastmcp import FastMCP
 
 async def print_tool_info(mcp):
     """Print information about all tools registered with the MCP server."""
-    print('\n=== Registered Tools ===\n')
+    # Collect all output lines and write them in one go instead of issuing
+    # a print call per line
+    lines = ['\n=== Registered Tools ===\n']
 
     # Use the list_tools method to get all registered tools
     tools = await mcp.list_tools()
 
     for tool in tools:
-        print(f'Tool: {tool.name}')
-        print(f'  Description: {tool.description}')
+        lines.append(f'Tool: {tool.name}')
+        lines.append(f'  Description: {tool.description}')
 
         # Print input schema if available
         if tool.inputSchema:
-            print('  Input Schema:')
+            lines.append('  Input Schema:')
             for prop_name, prop_info in tool.inputSchema.get('properties', {}).items():
                 prop_type = prop_info.get('type', 'any')
                 required = prop_name in tool.inputSchema.get('required', [])
                 req_str = ' (required)' if required else ''
-                print(f'    - {prop_name}: {prop_type}{req_str}')
+                lines.append(f'    - {prop_name}: {prop_type}{req_str}')
                 if 'description' in prop_info:
-                    print(f'      {prop_info["description"]}')
+                    lines.append(f'      {prop_info["description"]}')
 
-        print()  # Empty line for readability
+        lines.append('')  # Empty line for readability
+
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 async def main():
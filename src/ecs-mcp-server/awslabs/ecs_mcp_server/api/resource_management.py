@@ -26,6 +26,34 @@ from awslabs.ecs_mcp_server.utils.aws import get_aws_client
 
 logger = logging.getLogger(__name__)
 
+# Dispatch tables for resource handlers, keyed by resource type. Handlers are
+# wrapped in lambdas so the module-level functions are resolved at call time
+# and remain patchable in tests.
+LIST_HANDLERS = {
+    "cluster": lambda filters: list_clusters(filters),
+    "service": lambda filters: list_services(filters),
+    "task": lambda filters: list_tasks(filters),
+    "task_definition": lambda filters: list_task_definitions(filters),
+    "container_instance": lambda filters: list_container_instances(filters),
+    "capacity_provider": lambda filters: list_capacity_providers(filters),
+}
+
+# Describe handlers paired with whether they require a "cluster" filter.
+DESCRIBE_HANDLERS = {
+    "cluster": (lambda identifier, filters: describe_cluster(identifier, filters), False),
+    "service": (lambda identifier, filters: describe_service(identifier, filters), True),
+    "task": (lambda identifier, filters: describe_task(identifier, filters), True),
+    "task_definition": (lambda identifier, filters: describe_task_definition(identifier), False),
+    "container_instance": (
+        lambda identifier, filters: describe_container_instance(identifier, filters),
+        True,
+    ),
+    "capacity_provider": (
+        lambda identifier, filters: describe_capacity_provider(identifier),
+        False,
+    ),
+}
+
 
 async def ecs_resource_management(
     action: str,
@@ -57,68 +85,18 @@ async def ecs_resource_management(
         raise ValueError(f"Unsupported action: {action}. Must be 'list' or 'describe'")
 
     # Route to the appropriate handler based on action and resource_type
-    if resource_type == "cluster":
-        if action == "list":
-            return await list_clusters(filters)
-        elif action == "describe":
-            if not identifier:
-                raise ValueError("Identifier is required for describe_cluster")
-            return await describe_cluster(identifier, filters)
-
-    elif resource_type == "service":
-        if action == "list":
-            return await list_services(filters)
-        elif action == "describe":
-            if not identifier:
-                raise ValueError("Identifier is required for describe_service")
-            if "cluster" not in filters:
-                raise ValueError("Cluster filter is required for describe_service")
-            return await describe_service(identifier, filters)
-
-    elif resource_type == "task":
-        if action == "list":
-            return await list_tasks(filters)
-        elif action == "describe":
-            if not identifier:
-                raise ValueError("Identifier is required for describe_task")
-            if "cluster" not in filters:
-                raise ValueError("Cluster filter is required for describe_task")
-            return await describe_task(identifier, filters)
-
-    elif resource_type == "task_definition":
-        if action == "list":
-            return await list_task_definitions(filters)
-        elif action == "describe":
-            if not identifier:
-                raise ValueError("Identifier is required for describe_task_definition")
-            return await describe_task_definition(identifier)
-
-    elif resource_type == "container_instance":
-        if action == "list":
-            return await list_container_instances(filters)
-        elif action == "describe":
-            if not identifier:
-                raise ValueError("Identifier is required for describe_container_instance")
-            if "cluster" not in filters:
-                raise ValueError("Cluster filter is required for describe_container_instance")
-            return await describe_container_instance(identifier, filters)
-
-    elif resource_type == "capacity_provider":
-        if action == "list":
-            return await list_capacity_providers(filters)
-        elif action == "describe":
-            if not identifier:
-                raise ValueError("Identifier is required for describe_capacity_provider")
-            return await describe_capacity_provider(identifier)
-
-    else:
+    if resource_type not in LIST_HANDLERS:
         raise ValueError(f"Unsupported resource type: {resource_type}")
 
-    # Default return if no specific handler was called
-    return {
-        "error": f"No handler found for action '{action}' on resource type '{resource_type}'",
-        "status": "failed",
-    }
+    if action == "list":
+        return await LIST_HANDLERS[resource_type](filters)
+
+    describe_handler, requires_cluster_filter = DESCRIBE_HANDLERS[resource_type]
+    if not identifier:
+        raise ValueError(f"Identifier is required for describe_{resource_type}")
+    if requires_cluster_filter and "cluster" not in filters:
+        raise ValueError(f"Cluster filter is required for describe_{resource_type}")
+    return await describe_handler(identifier, filters)
 
 
 # ============ CLUSTER OPERATIONS ============
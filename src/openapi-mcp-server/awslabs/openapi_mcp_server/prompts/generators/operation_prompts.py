@@ -337,7 +337,8 @@ def generate_operation_documentation(
     doc_lines.append('```python')
 
     # Create example based on operation type
-    if method.lower() == 'get':
+    method_lower = method.lower()
+    if method_lower == 'get':
         # For GET operations
         param_str = ''
         if parameters:
@@ -363,7 +364,7 @@ def generate_operation_documentation(
 
         doc_lines.append(f'response = await {operation_id}({param_str})')
 
-    elif method.lower() == 'post':
+    elif method_lower == 'post':
         # For POST operations
         if request_body:
             doc_lines.append('data = {')
@@ -599,8 +600,9 @@ def create_operation_prompt(
             # Get tags from the OpenAPI operation object if available
             if isinstance(method, str) and paths is not None and path in paths:
                 path_item = paths.get(path, {})
-                if method.lower() in path_item:
-                    op = path_item[method.lower()]
+                method_lower = method.lower()
+                if method_lower in path_item:
+                    op = path_item[method_lower]
                     if 'tags' in op and isinstance(op.get('tags'), list):
                         for tag in op.get('tags', []):
                             if isinstance(tag, str):
@@ -16,6 +16,7 @@
 
 import asyncio
 import boto3
+import io
 import os
 import pandas as pd
 from .base import DataTarget
@@ -143,8 +144,11 @@ class S3Target(DataTarget):
         if format == 'parquet':
             return df.to_parquet(compression=compression)
         elif format == 'csv':
-            csv_data = df.to_csv(index=False)
-            return csv_data.encode() if csv_data is not None else b''
+            # Write straight into a bytes buffer in row chunks instead of
+            # building the full CSV as a string and encoding a second copy
+            buffer = io.BytesIO()
+            df.to_csv(buffer, index=False, chunksize=10000)
+            return buffer.getvalue()
         elif format == 'json':
             json_data = df.to_json(orient='records')
             return json_data.encode() if json_data is not None else b''